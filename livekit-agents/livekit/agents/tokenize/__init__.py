@@ -1,8 +1,5 @@
 from . import basic, utils
-from .token_stream import (
-    BufferedSentenceStream,
-    BufferedWordStream,
-)
+from .token_stream import BufferedTokenStream
 from .tokenizer import (
     SentenceStream,
     SentenceTokenizer,
@@ -17,8 +14,7 @@ __all__ = [
     "WordTokenizer",
     "WordStream",
     "TokenData",
-    "BufferedSentenceStream",
-    "BufferedWordStream",
+    "BufferedTokenStream",
     "basic",
     "utils",
 ]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import functools
 from dataclasses import dataclass
+from typing import cast
 
 from . import (
     _basic_hyphenator,
@@ -53,13 +54,16 @@ class SentenceTokenizer(tokenizer.SentenceTokenizer):
         ]
 
     def stream(self, *, language: str | None = None) -> tokenizer.SentenceStream:
-        return token_stream.BufferedSentenceStream(
-            tokenizer=functools.partial(
-                _basic_sent.split_sentences,
-                min_sentence_len=self._config.min_sentence_len,
+        return cast(
+            tokenizer.SentenceStream,
+            token_stream.BufferedTokenStream(
+                tokenize_fnc=functools.partial(
+                    _basic_sent.split_sentences,
+                    min_sentence_len=self._config.min_sentence_len,
+                ),
+                min_token_len=self._config.min_sentence_len,
+                min_ctx_len=self._config.stream_context_len,
             ),
-            min_token_len=self._config.min_sentence_len,
-            min_ctx_len=self._config.stream_context_len,
         )
 
 
@@ -76,12 +80,17 @@ class WordTokenizer(tokenizer.WordTokenizer):
         ]
 
     def stream(self, *, language: str | None = None) -> tokenizer.WordStream:
-        return token_stream.BufferedWordStream(
-            tokenizer=functools.partial(
-                _basic_word.split_words, ignore_punctuation=self._ignore_punctuation
+        return cast(
+            tokenizer.WordStream,
+            token_stream.BufferedTokenStream(
+                tokenize_fnc=functools.partial(
+                    _basic_word.split_words,
+                    ignore_punctuation=self._ignore_punctuation,
+                ),
+                min_token_len=1,
+                min_ctx_len=1,  # ignore
+                boundary_chars=" \t\r\n",  # words can only complete on whitespace
             ),
-            min_token_len=1,
-            min_ctx_len=1,  # ignore
         )
 
 
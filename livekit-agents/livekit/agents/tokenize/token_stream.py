@@ -1,15 +1,69 @@
 from __future__ import annotations
 
+import itertools
+import re
 import typing
-from typing import Callable, Union
+from typing import Callable, Iterable, Union
 
 from ..utils import aio, shortuuid
-from .tokenizer import SentenceStream, TokenData, WordStream
+from .tokenizer import TokenData
 
 # Tokenizers can either provide us with a list of tokens or a list of tokens along with their start and end indices.
-# If the start and end indices are not available, we attempt to locate the token within the text using str.find.
+# If the start and end indices are not available, we recover them once with a single left-to-right scan of the text.
 TokenizeCallable = Callable[[str], Union[list[str], list[tuple[str, int, int]]]]
 
+# a token can only complete once one of these characters shows up, so pushes
+# without any of them don't need to run the tokenizer at all
+DEFAULT_BOUNDARY_CHARS = ".!?\n\t "
+
+
+def _tokens_with_offsets(
+    tokens: Union[list[str], list[tuple[str, int, int]]], text: str
+) -> list[tuple[str, int, int]]:
+    """Normalize plain-string tokens to ``(token, start, end)`` tuples.
+
+    Each token is located at most once, starting the search at the end of the
+    previous token, so the whole pass stays linear in ``len(text)``.
+
+    The return shape of a tokenizer is fixed for a given call, so the
+    tuple/str dispatch happens once here and never inside the emit loops.
+    """
+    if not tokens or isinstance(tokens[0], tuple):
+        return typing.cast("list[tuple[str, int, int]]", tokens)
+
+    normalized: list[tuple[str, int, int]] = []
+    pos = 0
+    for tok in typing.cast("list[str]", tokens):
+        i = text.find(tok, pos)
+        if i < 0:
+            i = pos
+
+        pos = i + len(tok)
+        normalized.append((tok, i, pos))
+
+    return normalized
+
+
+def _tokens_verbatim(tokens: list[tuple[str, int, int]], text: str) -> bool:
+    """whether every token reads back unchanged from its span in ``text``
+
+    Tokenizers may rewrite the token text (e.g. the word tokenizer strips
+    punctuation), in which case the original spans can't be re-emitted as is.
+    The check compares in place, no slices are allocated.
+    """
+    return all(
+        tok[2] - tok[1] == len(tok[0]) and text.startswith(tok[0], tok[1])
+        for tok in tokens
+    )
+
+
+_WS_RE = re.compile(r"\s*")
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    """return the first index >= ``pos`` that isn't whitespace"""
+    return _WS_RE.match(text, pos).end()  # type: ignore[union-attr] # \s* always matches
+
 
 class BufferedTokenStream:
     def __init__(
@@ -18,73 +72,162 @@ class BufferedTokenStream:
         tokenize_fnc: TokenizeCallable,
         min_token_len: int,
         min_ctx_len: int,
+        boundary_chars: str = DEFAULT_BOUNDARY_CHARS,
     ) -> None:
         self._event_ch = aio.Chan[TokenData]()
         self._tokenize_fnc = tokenize_fnc
         self._min_ctx_len = min_ctx_len
         self._min_token_len = min_token_len
+        self._boundary_re = re.compile("[" + re.escape(boundary_chars) + "]")
+        self._text_re = re.compile("[^" + re.escape(boundary_chars) + "]")
+
+        # a buffered token can only be emitted once the buffer contains
+        # token text, then a boundary, then the start of the next token
+        self._has_text = False
+        self._has_boundary = False
+        self._tokenize_ready = False
+
         self._current_segment_id = shortuuid()
+        # whether anything was emitted under the current segment id; a fresh
+        # id is only generated once the previous one was actually used
+        self._segment_dirty = False
+
+        # incoming chunks are accumulated as parts and joined lazily, so many
+        # small pushes don't re-copy the whole buffer each time
+        self._buf_parts: list[str] = []
+        self._buf_len = 0
+
+    def _materialize_buf(self) -> str:
+        if len(self._buf_parts) > 1:
+            self._buf_parts = ["".join(self._buf_parts)]
+
+        return self._buf_parts[0] if self._buf_parts else ""
+
+    def _set_buf(self, text: str) -> None:
+        self._buf_parts = [text] if text else []
+        self._buf_len = len(text)
+        self._scan_boundary_state(text)
+
+    def _scan_boundary_state(self, text: str) -> None:
+        """recompute the text/boundary/text emission pre-check from scratch"""
+        self._has_text = self._has_boundary = self._tokenize_ready = False
+
+        m = self._text_re.search(text)
+        if m is None:
+            return
+
+        self._has_text = True
+        m = self._boundary_re.search(text, m.end())
+        if m is None:
+            return
 
-        self._buf_tokens: list[str] = []  # <= min_token_len
-        self._buf = ""
+        self._has_boundary = True
+        if self._text_re.search(text, m.end()):
+            self._tokenize_ready = True
 
-    @typing.no_type_check
     def push_text(self, text: str) -> None:
+        self.push_text_many((text,))
+
+    def push_text_many(self, chunks: Iterable[str]) -> None:
+        """push multiple chunks at once, running at most one tokenize pass"""
         self._check_not_closed()
-        self._buf += text
 
-        if len(self._buf) < self._min_ctx_len:
-            return
+        # hoist the attributes touched per chunk into locals, LOAD_FAST is
+        # considerably cheaper than LOAD_ATTR + method lookup in this loop
+        buf_parts = self._buf_parts
+        buf_len = self._buf_len
+        text_search = self._text_re.search
+        boundary_search = self._boundary_re.search
+
+        for text in chunks:
+            buf_parts.append(text)
+            buf_len += len(text)
+
+            # a mid-token chunk can't complete a token: only run the
+            # (potentially expensive) tokenizer once the emission pattern is
+            # present. The per-chunk updates ignore character order inside a
+            # chunk, which can only cause a spurious pass, never a missed one
+            if not self._tokenize_ready:
+                if not self._has_text:
+                    self._has_text = text_search(text) is not None
 
-        tokens = self._tokenize_fnc(self._buf)
+                if self._has_text and not self._has_boundary:
+                    self._has_boundary = boundary_search(text) is not None
 
-        buf_toks = []
-        buf = ""
-        while len(tokens) > 1:
-            if buf:
-                buf += " "
+                if self._has_boundary and text_search(text):
+                    self._tokenize_ready = True
 
-            tok = tokens.pop(0)
-            tok_text = tok
-            if isinstance(tok, tuple):
-                tok_text = tok[0]
+        self._buf_len = buf_len
 
-            buf += tok_text
-            buf_toks.append(tok)
-            if len(buf) >= self._min_token_len:
-                self._event_ch.send_nowait(
-                    TokenData(token=buf, segment_id=self._current_segment_id)
+        if not self._tokenize_ready or buf_len < self._min_ctx_len:
+            return
+
+        buf = self._materialize_buf()
+        tokens = _tokens_with_offsets(self._tokenize_fnc(buf), buf)
+        if len(tokens) <= 1:
+            # nothing to emit; may happen even past the readiness check, e.g.
+            # the word tokenizer strips a punctuation-only buffer down to []
+            return
+
+        # the token offsets all point inside the current buffer: it stays
+        # untouched during the scan (all but the possibly incomplete last
+        # token) and is sliced once at the end
+        last_end: int = 0
+        seg_parts: list[str] = []
+        seg_len: int = 0
+        pending: list[TokenData] = []
+        min_token_len = self._min_token_len
+        segment_id = self._current_segment_id
+        for tok in itertools.islice(tokens, len(tokens) - 1):
+            if seg_parts:
+                seg_parts.append(" ")
+                seg_len += 1
+
+            seg_parts.append(tok[0])
+            seg_len += len(tok[0])
+            if seg_len >= min_token_len:
+                pending.append(
+                    TokenData(
+                        token="".join(seg_parts),
+                        segment_id=segment_id,
+                    )
                 )
 
-                if isinstance(tok, tuple):
-                    self._buf = self._buf[tok[2] :]
-                else:
-                    for i, tok in enumerate(buf_toks):
-                        tok_i = max(self._buf.find(tok), 0)
-                        self._buf = self._buf[tok_i + len(tok) :].lstrip()
+                last_end = _skip_ws(buf, tok[2])
+                seg_parts = []
+                seg_len = 0
+
+        if pending:
+            self._event_ch.send_many(pending)
+            self._segment_dirty = True
 
-                buf_toks = []
-                buf = ""
+        if last_end > 0:
+            self._set_buf(buf[last_end:])
 
-    @typing.no_type_check
     def flush(self) -> None:
         self._check_not_closed()
-        if self._buf:
-            tokens = self._tokenize_fnc(self._buf)
-            if tokens:
-                if isinstance(tokens[0], tuple):
-                    buf = " ".join([tok[0] for tok in tokens])
-                else:
-                    buf = " ".join(tokens)
+        buf = self._materialize_buf()
+        if buf:
+            tokens = _tokens_with_offsets(self._tokenize_fnc(buf), buf)
+            if not tokens:
+                text = buf
+            elif _tokens_verbatim(tokens, buf):
+                # re-emit the original span directly: no join, and the
+                # source's own spacing between tokens is preserved
+                text = buf[tokens[0][1] : tokens[-1][2]]
             else:
-                buf = self._buf
+                text = " ".join([tok[0] for tok in tokens])
 
             self._event_ch.send_nowait(
-                TokenData(token=buf, segment_id=self._current_segment_id)
+                TokenData(token=text, segment_id=self._current_segment_id)
             )
+            self._segment_dirty = True
+
+        if self._segment_dirty:
             self._current_segment_id = shortuuid()
+            self._segment_dirty = False
 
-        self._buf = ""
+        self._set_buf("")
 
     def end_input(self) -> None:
         self.flush()
@@ -103,33 +246,3 @@ class BufferedTokenStream:
 
     async def __anext__(self) -> TokenData:
         return await self._event_ch.__anext__()
-
-
-class BufferedSentenceStream(BufferedTokenStream, SentenceStream):
-    def __init__(
-        self,
-        *,
-        tokenizer: TokenizeCallable,
-        min_token_len: int,
-        min_ctx_len: int,
-    ) -> None:
-        super().__init__(
-            tokenize_fnc=tokenizer,
-            min_token_len=min_token_len,
-            min_ctx_len=min_ctx_len,
-        )
-
-
-class BufferedWordStream(BufferedTokenStream, WordStream):
-    def __init__(
-        self,
-        *,
-        tokenizer: TokenizeCallable,
-        min_token_len: int,
-        min_ctx_len: int,
-    ) -> None:
-        super().__init__(
-            tokenize_fnc=tokenizer,
-            min_token_len=min_token_len,
-            min_ctx_len=min_ctx_len,
-        )
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import AsyncIterator
+from typing import AsyncIterator, NamedTuple
 
 from ..utils import aio
 
@@ -13,8 +12,9 @@ PUNCTUATIONS = ['!', '"', '#', '$', '%', '&', "'", '(', ')', '*', '+', ',', '-',
 # fmt: on
 
 
-@dataclass
-class TokenData:
+class TokenData(NamedTuple):
+    # a NamedTuple rather than a dataclass: one TokenData is allocated per
+    # emitted token, and the tuple layout avoids carrying a __dict__ around
     segment_id: str = ""
     token: str = ""
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 from collections import deque
-from typing import AsyncIterator, Deque, Generic, Protocol, TypeVar
+from typing import AsyncIterator, Deque, Generic, Iterable, Protocol, TypeVar
 
 T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
@@ -30,6 +30,8 @@ class ChanSender(Protocol[T_contra]):
 
     def send_nowait(self, value: T_contra) -> None: ...
 
+    def send_many(self, values: Iterable[T_contra]) -> None: ...
+
     def close(self) -> None: ...
 
 
@@ -94,6 +96,25 @@ class Chan(Generic[T]):
         self._queue.append(value)
         self._wakeup_next(self._gets)
 
+    def send_many(self, values: Iterable[T]) -> None:
+        """queue multiple values at once, cheaper than calling send_nowait per value
+
+        Raises ChanFull without queuing anything if the values don't all fit within maxsize.
+        """
+        values = list(values)
+        if self._maxsize > 0 and self.qsize() + len(values) > self._maxsize:
+            raise ChanFull
+
+        if self._close_ev.is_set():
+            raise ChanClosed
+
+        self._queue.extend(values)
+        for _ in values:
+            if not self._gets:
+                break
+
+            self._wakeup_next(self._gets)
+
     async def recv(self) -> T:
         while self.empty() and not self._close_ev.is_set():
             g = self._loop.create_future()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import dataclasses
 import functools
 from dataclasses import dataclass
+from typing import cast
 
 from livekit import agents
 
@@ -60,10 +61,13 @@ class SentenceTokenizer(agents.tokenize.SentenceTokenizer):
 
     def stream(self, *, language: str | None = None) -> agents.tokenize.SentenceStream:
         config = self._sanitize_options(language=language)
-        return agents.tokenize.BufferedSentenceStream(
-            tokenizer=functools.partial(
-                nltk.tokenize.sent_tokenize, language=config.language
+        return cast(
+            agents.tokenize.SentenceStream,
+            agents.tokenize.BufferedTokenStream(
+                tokenize_fnc=functools.partial(
+                    nltk.tokenize.sent_tokenize, language=config.language
+                ),
+                min_token_len=self._config.min_sentence_len,
+                min_ctx_len=self._config.stream_context_len,
             ),
-            min_token_len=self._config.min_sentence_len,
-            min_ctx_len=self._config.stream_context_len,
         )
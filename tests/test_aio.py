@@ -24,6 +24,26 @@ async def test_channel():
     assert sum == 10
 
 
+async def test_channel_send_many():
+    tx = rx = aio.Chan[int]()
+    sum = 0
+
+    async def test_task():
+        nonlocal sum
+        while True:
+            try:
+                sum = sum + await rx.recv()
+            except aio.ChanClosed:
+                break
+
+    t = asyncio.create_task(test_task())
+    tx.send_many([1] * 10)
+
+    tx.close()
+    await t
+    assert sum == 10
+
+
 async def test_interval():
     interval = aio.interval(0.1)
 
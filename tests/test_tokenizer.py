@@ -118,6 +118,24 @@ async def test_streamed_word_tokenizer(tokenizer: tokenize.WordTokenizer):
         assert ev.token == WORDS_EXPECTED[i]
 
 
+@pytest.mark.parametrize("tokenizer", WORD_TOKENIZERS)
+async def test_streamed_word_tokenizer_punctuation_only(
+    tokenizer: tokenize.WordTokenizer,
+):
+    # punctuation-only text is stripped down to no tokens at all and must not
+    # crash the stream
+    stream = tokenizer.stream()
+    stream.push_text(", .")
+    stream.push_text("a ... ...")
+    stream.end_input()
+
+    tokens = []
+    async for ev in stream:
+        tokens.append(ev.token)
+
+    assert tokens == ["a"]
+
+
 HYPHENATOR_TEXT = [
     "Segment",
     "expected",